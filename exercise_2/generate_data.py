@@ -21,12 +21,15 @@ def _parse_user_args():
     arg_parser.add_argument('-i', '--ip', nargs='?', default="localhost",
                             help="connection ip, defaults to localhost")
     arg_parser.add_argument('-p', '--port', nargs='?', default="5432", help="connection port, defaults to 5432")
+    arg_parser.add_argument('--disable-triggers', action='store_true',
+                            help="skip the foreign key checks while loading, faster but the user must be a superuser")
     return arg_parser.parse_args()
 
 
 if __name__ == "__main__":
     args = _parse_user_args()
     db_manager = ScientificCommunityDBManager.create(database=args.database, password=args.password, user=args.user,
-                                                     host=args.ip, port=args.port)
+                                                     host=args.ip, port=args.port, verbose=True,
+                                                     disable_triggers=args.disable_triggers)
     db_manager.truncate_tables()
     db_manager.generate_and_insert_fake_data()
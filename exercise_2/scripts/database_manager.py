@@ -1,13 +1,19 @@
+import csv
 import functools
+import io
 import random
+from itertools import chain
 
 import psycopg2
-from psycopg2.extras import execute_values
 
 import exercise_2.scripts.constants as c
 import exercise_2.scripts.factories as f
 
 
+# size of the chunks the COPY buffers are sent to the server in
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+
 def safe_connection(error_msg=None):
     """
     A decorator that wraps the passed in function closes the db connection on error safely.
@@ -30,49 +36,61 @@ class _SQL(object):
     ADJUST_DATE_SQL = """
     SET datestyle = dmy
     """
+    # skips the foreign key triggers while loading, requires a superuser
+    DISABLE_TRIGGERS_SQL = """
+    SET session_replication_role = replica
+    """
+    ENABLE_TRIGGERS_SQL = """
+    SET session_replication_role = origin
+    """
+    # the manager is a bulk loading utility, commits do not need to wait for the WAL to be flushed
+    BULK_LOAD_SESSION_SQL = """
+    SET synchronous_commit = off;
+    SET client_min_messages = warning
+    """
     ADDRESS_SQL = """
-        insert into address(address_name, address_number, city, country, postal_code)
-        values %s
+        copy address(address_name, address_number, city, country, postal_code)
+        from stdin with (format csv)
    """
     FACULTY_SQL = """
-        insert into faculty(name, university_name)
-        values %s
+        copy faculty(name, university_name)
+        from stdin with (format csv)
     """
     CONFERENCE_SQL = """
-        insert into conference(faculty_id, address_id, start_date, end_date, title, fee)
-        values %s
+        copy conference(faculty_id, address_id, start_date, end_date, title, fee)
+        from stdin with (format csv)
     """
     SCIENTIST_SQL = """
-        insert into scientist(title, name, surname)
-        values %s
+        copy scientist(title, name, surname)
+        from stdin with (format csv)
     """
     PHD_SQL = """
-        insert into phd(date_received, description, supervisor_id, title, scientist_id)
-        values %s
+        copy phd(date_received, description, supervisor_id, title, scientist_id)
+        from stdin with (format csv)
     """
     SCIENTIST_WORKS_AT_FACULTY_SQL = """
-        insert into scientist_works_at_faculty(faculty_id, scientist_id)
-        values %s
+        copy scientist_works_at_faculty(faculty_id, scientist_id)
+        from stdin with (format csv)
     """
     FUNDING_SQL = """
-        insert into funding(scientist_id, funder, budget, start_date, end_date)
-        values %s
+        copy funding(scientist_id, funder, budget, start_date, end_date)
+        from stdin with (format csv)
     """
     FUNDING_FUNDS_PHD_SQL = """
-       insert into funding_funds_phd(funding_id, phd_id, working_hours_spent)
-       values %s
+       copy funding_funds_phd(funding_id, phd_id, working_hours_spent)
+       from stdin with (format csv)
    """
     PUBLICATION_SQL = """
-       insert into publication(main_author_id, title, summary, conference_id, funding_id, won_first_prize)
-       values %s
+       copy publication(main_author_id, title, summary, conference_id, funding_id, won_first_prize)
+       from stdin with (format csv)
    """
     PUBLICATION_SECONDARY_AUTHOR_SQL = """
-       insert into publication_secondary_author(author_id, publication_id)
-       values %s
+       copy publication_secondary_author(author_id, publication_id)
+       from stdin with (format csv)
    """
     SCIENTIST_PARTICIPATES_AT_CONFERENCE_SQL = """
-       insert into scientist_participates_at_conference(conference_id, scientist_id, is_volunteer)
-       values %s
+       copy scientist_participates_at_conference(conference_id, scientist_id, is_volunteer)
+       from stdin with (format csv)
    """
 
 
@@ -82,6 +100,7 @@ class ScientificCommunityDBManager(object):
     def __init__(self):
         self._conn = None
         self._cursor = None
+        self._disable_triggers = False
 
     def __str__(self):
         return f"ScientificCommunityDBManager(db_id={id(self._conn)})"
@@ -100,126 +119,122 @@ class ScientificCommunityDBManager(object):
         conf_num = 50
         sc_per_fac = 40
 
+        if self._disable_triggers:
+            # skip the foreign key checks, every id referenced below is generated here along with its row
+            self._cursor.execute(_SQL.DISABLE_TRIGGERS_SQL)
         # generate and insert faculties
-        faculties = list(f.FacultyFactory.generate_unique_faculties())
-        values = [[fac.name, fac.university_name] for fac in faculties]
-        execute_values(self._cursor, sql=_SQL.FACULTY_SQL, argslist=values)
+        self._copy(_SQL.FACULTY_SQL, ((fac.name, fac.university_name)
+                                      for fac in f.FacultyFactory.generate_unique_faculties()))
 
         # generate and insert addresses
-        addresses = list(f.AddressFactory.generate_addresses(n=conf_num))
-        values = [[ad.address_name, ad.address_number, ad.city, ad.country, ad.postal_code] for ad in addresses]
-        execute_values(self._cursor, sql=_SQL.ADDRESS_SQL, argslist=values)
+        self._copy(_SQL.ADDRESS_SQL, ((ad.address_name, ad.address_number, ad.city, ad.country, ad.postal_code)
+                                      for ad in f.AddressFactory.generate_addresses(n=conf_num)))
 
         # adjust date
         self._cursor.execute(_SQL.ADJUST_DATE_SQL)
         # generate and insert conferences
-        conferences = list(f.ConferenceFactory.generate_unique_conferences())
-        self._map_conferences(conferences, conf_num, fac_num)
-        values = [[conf.faculty_id, conf.address_id, conf.start_date, conf.end_date, conf.title, conf.fee]
-                  for conf in conferences]
-        execute_values(self._cursor, sql=_SQL.CONFERENCE_SQL, argslist=values)
+        conferences = self._iter_mapped_conferences(f.ConferenceFactory.generate_unique_conferences(), conf_num,
+                                                    fac_num)
+        self._copy(_SQL.CONFERENCE_SQL, ((conf.faculty_id, conf.address_id, conf.start_date, conf.end_date,
+                                          conf.title, conf.fee) for conf in conferences))
 
         # generate and insert scientists along with their phds, publications and funding
-        self._generate_and_insert_scientist_relations(fac_num, sc_per_fac, len(conferences))
+        self._generate_and_insert_scientist_relations(fac_num, sc_per_fac, len(c.CONFERENCES))
+        if self._disable_triggers:
+            self._cursor.execute(_SQL.ENABLE_TRIGGERS_SQL)
         self._conn.commit()
 
     @staticmethod
-    def _map_conferences(conferences, conf_num, fac_num):
+    def _iter_mapped_conferences(conferences, conf_num, fac_num):
         """
         Maps conferences to their faculties and addresses
-        :param conferences: a list with Conference objects
+        :param conferences: an iterable of Conference objects
         :param conf_num: number of conferences
         :param fac_num: number of faculties
+        :returns: a generator of the mapped Conference objects
         """
-        fac_id = 1
         conf_per_fac = conf_num // fac_num
-        for idx, conf in enumerate(conferences, start=1):
-            conf.faculty_id = fac_id
-            conf.address_id = idx
-            if idx % conf_per_fac == 0:
-                fac_id += 1
+        for idx, conf in enumerate(conferences):
+            conf.faculty_id = idx // conf_per_fac + 1
+            conf.address_id = idx + 1
+            yield conf
 
     def _generate_and_insert_scientist_relations(self, fac_num, sc_per_fac, conf_num):
         """
         Generates and inserts scientists to their faculties and phds
         ScientistFactory.generate_scientists_per_title
+        The rows of all faculties are accumulated per table and loaded with a single COPY each
         :param fac_num: number of faculties
         :param sc_per_fac: number of scientists per faculty
         :param conf_num: number of conferences
         """
-        fac_id = 1
-        phd_starting_id = 1
-        scientist_starting_id = 1
-        funding_starting_id = 1
-        publication_starting_id = 1
         # tracks which publications have already won a first prize
         won_first_prize_ids = set()
         scientists_participate_at_conf_mapping = {k: set() for k in range(1, conf_num + 1)}
-        for i in range(1, fac_num + 1):
+        # rows per table, in foreign key dependency order
+        rows = {sql: [] for sql in (_SQL.SCIENTIST_SQL, _SQL.SCIENTIST_WORKS_AT_FACULTY_SQL, _SQL.PHD_SQL,
+                                    _SQL.FUNDING_SQL, _SQL.FUNDING_FUNDS_PHD_SQL, _SQL.PUBLICATION_SQL,
+                                    _SQL.PUBLICATION_SECONDARY_AUTHOR_SQL,
+                                    _SQL.SCIENTIST_PARTICIPATES_AT_CONFERENCE_SQL)}
+        scientist_starting_id = phd_starting_id = funding_starting_id = publication_starting_id = 1
+        for fac_id in range(1, fac_num + 1):
             scientists = f.ScientistFactory.generate_scientists_per_title(sc_per_fac, start=scientist_starting_id)
-            plain_scientists = [sc for sc_list in scientists.values() for sc in sc_list]
+            prof_list = list(chain(scientists[c.PROFESSOR], scientists[c.ASSISTANT_PROFESSOR],
+                                   scientists[c.ASSOCIATE_PROFESSOR]))
+            non_prof_list = list(chain(scientists[c.LECTURER], scientists[c.RESEARCHER],
+                                       scientists[c.LABORATORY_TEACHING_STAFF]))
+            prof_num = len(prof_list)
+            phd_num = len(non_prof_list)
+            phds = f.PHDFactory.generate_phd_columns(phd_num, start=phd_starting_id)
+            funding = f.FundingFactory.generate_funding_columns(prof_num, start=funding_starting_id)
+            publications = f.PublicationFactory.generate_publication_columns(prof_num, start=publication_starting_id)
+            # update ids
+            scientist_starting_id += sc_per_fac
+            phd_starting_id += phd_num
+            funding_starting_id += prof_num
+            publication_starting_id += prof_num
+            # in id order, so that the serial ids given by the database match the ids the relations refer to
+            plain_scientists = sorted(chain.from_iterable(scientists.values()), key=lambda sc: sc.scientist_id)
             # insert scientists
-            values = [[sc.title, sc.name, sc.surname] for sc in plain_scientists]
-            execute_values(self._cursor, sql=_SQL.SCIENTIST_SQL, argslist=values)
+            rows[_SQL.SCIENTIST_SQL].extend([sc.title, sc.name, sc.surname] for sc in plain_scientists)
             # insert scientist_works_at_faculty relation
-            values = [[fac_id, sc.scientist_id] for sc in plain_scientists]
-            execute_values(self._cursor, sql=_SQL.SCIENTIST_WORKS_AT_FACULTY_SQL, argslist=values)
+            rows[_SQL.SCIENTIST_WORKS_AT_FACULTY_SQL].extend([fac_id, sc.scientist_id] for sc in plain_scientists)
             # insert phds
-            prof_list = scientists[c.PROFESSOR] + scientists[c.ASSISTANT_PROFESSOR] + scientists[c.ASSOCIATE_PROFESSOR]
-            prof_num = len(prof_list)
-            non_prof_list = scientists[c.LECTURER] + scientists[c.RESEARCHER] + scientists[c.LABORATORY_TEACHING_STAFF]
-            phd_num = len(non_prof_list)
-            phds = list(f.PHDFactory.generate_phds(phd_num, start=phd_starting_id))
-            for j in range(phd_num):
-                phds[j].scientist_id = non_prof_list[j].scientist_id
-                for prof in random.choices(prof_list):
-                    phds[j].supervisor_id = prof.scientist_id
-            values = [[phd.date_received, phd.description, phd.supervisor_id, phd.title, phd.scientist_id]
-                      for phd in phds]
-            execute_values(self._cursor, sql=_SQL.PHD_SQL, argslist=values)
+            prof_ids = [prof.scientist_id for prof in prof_list]
+            # draw all the supervisors at once
+            supervisor_ids = random.choices(prof_ids, k=phd_num)
+            rows[_SQL.PHD_SQL].extend(zip(phds["date_received"], phds["description"], supervisor_ids, phds["title"],
+                                          (non_prof.scientist_id for non_prof in non_prof_list)))
             # insert funding
-            funding = list(f.FundingFactory.generate_funding(prof_num, funding_starting_id))
-            funding_num = len(funding)
-            values = []
-            for j in range(prof_num):
-                funding[j].scientist_id = prof_list[j].scientist_id
-                values.append([funding[j].scientist_id, funding[j].funder, funding[j].budget, funding[j].start_date,
-                               funding[j].end_date])
-            execute_values(self._cursor, sql=_SQL.FUNDING_SQL, argslist=values)
+            rows[_SQL.FUNDING_SQL].extend(zip(prof_ids, funding["funder"], funding["budget"], funding["start_date"],
+                                              funding["end_date"]))
             # give each phd a funding randomly
-            values = []
-            for phd in phds:
-                for fund in random.choices(funding):
-                    values.append([fund.funding_id, phd.phd_id, f.MiscMixin.phd_working_hours(fund.budget)])
-            execute_values(self._cursor, sql=_SQL.FUNDING_FUNDS_PHD_SQL, argslist=values)
+            funding_ids, budgets = funding["funding_id"], funding["budget"]
+            values = rows[_SQL.FUNDING_FUNDS_PHD_SQL]
+            for phd_id, fund_idx in zip(phds["phd_id"], random.choices(range(prof_num), k=phd_num)):
+                values.append([funding_ids[fund_idx], phd_id, f.FakeGenerator.phd_working_hours(budgets[fund_idx])])
             # insert publications
-            publications = list(f.PublicationFactory.generate_publications(prof_num, publication_starting_id))
-            publications_num = len(publications)
-            values = []
-            for j in range(prof_num):
-                publications[j].main_author_id = prof_list[j].scientist_id
-                publications[j].funding_id = random.randint(funding_starting_id, len(funding) + funding_starting_id - 1)
-                publications[j].conference_id = random.randint(1, conf_num)
+            values = rows[_SQL.PUBLICATION_SQL]
+            for main_author_id, title, summary in zip(prof_ids, publications["title"], publications["summary"]):
+                conference_id = random.randint(1, conf_num)
+                won_first_prize = False
                 # if there is no other first prize publication in the conference, attempt to win the first prize
-                if not publications[j].conference_id in won_first_prize_ids:
-                    if f.MiscMixin.publication_wins_first_prize():
-                        publications[j].won_first_prize = True
-                        won_first_prize_ids.add(publications[j].conference_id)
-                values.append([publications[j].main_author_id, publications[j].title, publications[j].summary,
-                               publications[j].conference_id, publications[j].funding_id,
-                               publications[j].won_first_prize])
-            execute_values(self._cursor, sql=_SQL.PUBLICATION_SQL, argslist=values)
+                if conference_id not in won_first_prize_ids:
+                    if f.FakeGenerator.publication_wins_first_prize():
+                        won_first_prize = True
+                        won_first_prize_ids.add(conference_id)
+                values.append([main_author_id, title, summary, conference_id, random.choice(funding_ids),
+                               won_first_prize])
             # insert publication secondary authors
-            values = []
-            for pub in publications:
+            values = rows[_SQL.PUBLICATION_SECONDARY_AUTHOR_SQL]
+            for pub_id in publications["publication_id"]:
                 # select up to five non professor individuals for each publication
                 temp_list = non_prof_list[:]
-                for non_prof in f.MiscMixin.choices_no_replacement(temp_list, k=random.randint(1, 5)):
-                    values.append([non_prof.scientist_id, pub.publication_id])
-            execute_values(self._cursor, sql=_SQL.PUBLICATION_SECONDARY_AUTHOR_SQL, argslist=values)
+                for non_prof in f.FakeGenerator.choices_no_replacement(temp_list, k=random.randint(1, 5)):
+                    values.append([non_prof.scientist_id, pub_id])
 
             # insert scientist participates at conference randomly
-            values = []
+            values = rows[_SQL.SCIENTIST_PARTICIPATES_AT_CONFERENCE_SQL]
             for sc in plain_scientists:
                 # get a random_conference id
                 conference_id = random.randint(1, conf_num)
@@ -227,16 +242,24 @@ class ScientificCommunityDBManager(object):
                     # scientist already participated in that conference
                     continue
                 scientists_participate_at_conf_mapping[conference_id].add(sc.scientist_id)
-                is_volunteer = f.MiscMixin.is_volunteer()
+                is_volunteer = f.FakeGenerator.is_volunteer()
                 values.append([conference_id, sc.scientist_id, is_volunteer])
-            execute_values(self._cursor, sql=_SQL.SCIENTIST_PARTICIPATES_AT_CONFERENCE_SQL, argslist=values)
 
-            # update ids
-            phd_starting_id += phd_num
-            scientist_starting_id += sc_per_fac
-            funding_starting_id += funding_num
-            publication_starting_id += publications_num
-            fac_id += 1
+        for sql, values in rows.items():
+            self._copy(sql, values)
+
+    def _copy(self, sql, rows):
+        """
+        Bulk loads the given rows with a single COPY ... FROM STDIN statement
+        :param sql: a COPY statement expecting csv input
+        :param rows: an iterable of rows, each one matching the columns of the statement
+        """
+        buf = io.StringIO()
+        csv.writer(buf, lineterminator="\n").writerows(rows)
+        buf.seek(0)
+        # send the buffer in 1MB chunks instead of the default 8kB ones, bounded so that big loads are not copied
+        # into a single string and a single message
+        self._cursor.copy_expert(sql, buf, size=_COPY_CHUNK_SIZE)
 
     @safe_connection("Error in executing commit method")
     def commit(self):
@@ -244,36 +267,49 @@ class ScientificCommunityDBManager(object):
         self._conn.commit()
 
     def truncate_tables(self):
-        sql = """select table_name from information_schema.tables where table_schema = 'public'"""
+        sql = """select string_agg(quote_ident(table_name), ', ') from information_schema.tables
+                 where table_schema = 'public'"""
         self._cursor.execute(sql)
-        for table_name in self._cursor.fetchall():
-            self._truncate_table(table_name)
+        table_names = self._cursor.fetchone()[0]
+        if table_names:
+            self._truncate_tables(table_names)
         self._conn.commit()
 
-    def _truncate_table(self, table_name):
-        sql = """truncate "%s" restart identity cascade""" % table_name
+    def _truncate_tables(self, table_names):
+        """
+        Truncates all the given tables with a single statement
+        :param table_names: comma separated and quoted table names
+        """
+        sql = """truncate %s restart identity cascade""" % table_names
         self._cursor.execute(sql)
 
     @classmethod
-    def create(cls, database, password, user="postgres", host="localhost", port="5432"):
+    def create(cls, database, password, user="postgres", host="localhost", port="5432", verbose=False,
+               disable_triggers=False):
         """
         :param database: database name
         :param password: password for the specified database user
         :param user: database user - defaults to postgres
         :param host: host ip - defaults to localhost
         :param port: connection port - defaults to 5432
+        :param verbose: print the server version and the connection details - defaults to False
+        :param disable_triggers: skip the foreign key checks while loading, the user must be a superuser
+         - defaults to False
         :rtype: ScientificCommunityDBManager
         """
         db_manager = cls()
+        db_manager._disable_triggers = disable_triggers
         try:
             conn = psycopg2.connect(database=database, password=password, user=user, host=host, port=port)
             cursor = conn.cursor()
             db_manager._conn = conn
             db_manager._cursor = cursor
-            cursor.execute("SELECT version();")
-            record = cursor.fetchone()
-            print(f"You are connected into the - {record}\n")
-            print(f"DSN details: {conn.get_dsn_parameters()}\n")
+            cursor.execute(_SQL.BULK_LOAD_SESSION_SQL)
+            if verbose:
+                cursor.execute("SELECT version();")
+                record = cursor.fetchone()
+                print(f"You are connected into the - {record}\n")
+                print(f"DSN details: {conn.get_dsn_parameters()}\n")
             return db_manager
         except(Exception, psycopg2.Error) as error:
             print("Error connecting to PostgreSQL database", error)
@@ -3,6 +3,8 @@
 
 class BaseEntity(object):
     """BaseEntity Object"""
+    __slots__ = ()
+
     @classmethod
     def build_from_data(cls, data: dict):
         """Builds the object from the given data"""
@@ -18,13 +20,16 @@ class BaseEntity(object):
 
 class Address(BaseEntity):
     """Represents an Address entity"""
-    def __init__(self):
-        self.address_id = None
-        self.address_name = None
-        self.address_number = None
-        self.city = None
-        self.country = None
-        self.postal_code = None
+    __slots__ = ('address_id', 'address_name', 'address_number', 'city', 'country', 'postal_code')
+
+    def __init__(self, address_id=None, address_name=None, address_number=None, city=None, country=None,
+                 postal_code=None):
+        self.address_id = address_id
+        self.address_name = address_name
+        self.address_number = address_number
+        self.city = city
+        self.country = country
+        self.postal_code = postal_code
 
     def __str__(self):
         return f"Address(address_id={self.address_id})"
@@ -36,14 +41,17 @@ class Address(BaseEntity):
 
 class Conference(BaseEntity):
     """Represents a Conference entity"""
-    def __init__(self):
-        self.conference_id = None
-        self.faculty_id = None
-        self.address_id = None
-        self.start_date = None
-        self.end_date = None
-        self.title = None
-        self.fee = None
+    __slots__ = ('conference_id', 'faculty_id', 'address_id', 'start_date', 'end_date', 'title', 'fee')
+
+    def __init__(self, conference_id=None, faculty_id=None, address_id=None, start_date=None, end_date=None, title=None,
+                 fee=None):
+        self.conference_id = conference_id
+        self.faculty_id = faculty_id
+        self.address_id = address_id
+        self.start_date = start_date
+        self.end_date = end_date
+        self.title = title
+        self.fee = fee
 
     def __str__(self):
         return f"Conference(conference_id={self.conference_id}, faculty_id={self.faculty_id})"
@@ -51,11 +59,12 @@ class Conference(BaseEntity):
 
 class Faculty(BaseEntity):
     """Represents a Faculty entity"""
+    __slots__ = ('faculty_id', 'name', 'university_name')
 
-    def __init__(self):
-        self.faculty_id = None
-        self.name = None
-        self.university_name = None
+    def __init__(self, faculty_id=None, name=None, university_name=None):
+        self.faculty_id = faculty_id
+        self.name = name
+        self.university_name = university_name
 
     def __str__(self):
         return f"Faculty(faculty_id={self.faculty_id})"
@@ -63,14 +72,15 @@ class Faculty(BaseEntity):
 
 class Funding(BaseEntity):
     """Represents a Funding entity"""
+    __slots__ = ('funding_id', 'scientist_id', 'funder', 'budget', 'start_date', 'end_date')
 
-    def __init__(self):
-        self.funding_id = None
-        self.scientist_id = None
-        self.funder = None
-        self.budget = None
-        self.start_date = None
-        self.end_date = None
+    def __init__(self, funding_id=None, scientist_id=None, funder=None, budget=None, start_date=None, end_date=None):
+        self.funding_id = funding_id
+        self.scientist_id = scientist_id
+        self.funder = funder
+        self.budget = budget
+        self.start_date = start_date
+        self.end_date = end_date
 
     def __str__(self):
         return f"Funding(funding_id={self.funding_id}, scientist_id={self.scientist_id})"
@@ -78,11 +88,12 @@ class Funding(BaseEntity):
 
 class FundingFundsPHD(BaseEntity):
     """Represents a FundingFundsPHD entity"""
+    __slots__ = ('funding_id', 'phd_id', 'working_hours_spent')
 
-    def __init__(self):
-        self.funding_id = None
-        self.phd_id = None
-        self.working_hours_spent = None
+    def __init__(self, funding_id=None, phd_id=None, working_hours_spent=None):
+        self.funding_id = funding_id
+        self.phd_id = phd_id
+        self.working_hours_spent = working_hours_spent
 
     def __str__(self):
         return f"FundingFundsPHD(funding_id={self.funding_id}, phd_id={self.phd_id})"
@@ -90,14 +101,16 @@ class FundingFundsPHD(BaseEntity):
 
 class PHD(BaseEntity):
     """Represents a PHD entity"""
+    __slots__ = ('phd_id', 'date_received', 'description', 'supervisor_id', 'title', 'scientist_id')
 
-    def __init__(self):
-        self.phd_id = None
-        self.date_received = None
-        self.description = None
-        self.supervisor_id = None
-        self.title = None
-        self.scientist_id = None
+    def __init__(self, phd_id=None, date_received=None, description=None, supervisor_id=None, title=None,
+                 scientist_id=None):
+        self.phd_id = phd_id
+        self.date_received = date_received
+        self.description = description
+        self.supervisor_id = supervisor_id
+        self.title = title
+        self.scientist_id = scientist_id
 
     def __str__(self):
         return f"PHD(phd_id={self.phd_id}, scientist_id={self.scientist_id})"
@@ -105,15 +118,18 @@ class PHD(BaseEntity):
 
 class Publication(BaseEntity):
     """Represents a Publication entity"""
-
-    def __init__(self):
-        self.publication_id = None
-        self.main_author_id = None
-        self.title = None
-        self.summary = None
-        self.conference_id = None
-        self.funding_id = None
-        self.won_first_prize = None
+    __slots__ = ('publication_id', 'main_author_id', 'title', 'summary', 'conference_id', 'funding_id',
+                 'won_first_prize')
+
+    def __init__(self, publication_id=None, main_author_id=None, title=None, summary=None, conference_id=None,
+                 funding_id=None, won_first_prize=None):
+        self.publication_id = publication_id
+        self.main_author_id = main_author_id
+        self.title = title
+        self.summary = summary
+        self.conference_id = conference_id
+        self.funding_id = funding_id
+        self.won_first_prize = won_first_prize
 
     def __str__(self):
         return f"Publication(publication_id={self.publication_id}, main_author_id=({self.main_author_id})"
@@ -121,10 +137,11 @@ class Publication(BaseEntity):
 
 class PublicationSecondaryAuthor(BaseEntity):
     """Represents a PublicationSecondaryAuthor entity"""
+    __slots__ = ('publication_id', 'scientist_id')
 
-    def __init__(self):
-        self.publication_id = None
-        self.scientist_id = None
+    def __init__(self, publication_id=None, scientist_id=None):
+        self.publication_id = publication_id
+        self.scientist_id = scientist_id
 
     def __str__(self):
         return f"PublicationSecondaryAuthor(publication_id={self.publication_id}, scientist_id=({self.scientist_id})"
@@ -132,12 +149,13 @@ class PublicationSecondaryAuthor(BaseEntity):
 
 class Scientist(BaseEntity):
     """Represents a Scientist entity"""
+    __slots__ = ('scientist_id', 'title', 'name', 'surname')
 
-    def __init__(self):
-        self.scientist_id = None
-        self.title = None
-        self.name = None
-        self.surname = None
+    def __init__(self, scientist_id=None, title=None, name=None, surname=None):
+        self.scientist_id = scientist_id
+        self.title = title
+        self.name = name
+        self.surname = surname
 
     def __str__(self):
         return f"Scientist(scientist_id={self.scientist_id})"
@@ -145,12 +163,13 @@ class Scientist(BaseEntity):
 
 class ScientistParticipatesAtConference(BaseEntity):
     """Represents a ScientistParticipatesAtConference entity"""
+    __slots__ = ('conference_id', 'scientist_id', 'is_volunteer', 'fee')
 
-    def __init__(self):
-        self.conference_id = None
-        self.scientist_id = None
-        self.is_volunteer = None
-        self.fee = None
+    def __init__(self, conference_id=None, scientist_id=None, is_volunteer=None, fee=None):
+        self.conference_id = conference_id
+        self.scientist_id = scientist_id
+        self.is_volunteer = is_volunteer
+        self.fee = fee
 
     def __str__(self):
         return f"ScientistParticipatesAtConference(scientist_id={self.scientist_id}, " \
@@ -159,10 +178,11 @@ class ScientistParticipatesAtConference(BaseEntity):
 
 class ScientistWorksAtFaculty(BaseEntity):
     """Represents a ScientistWorksAtFaculty entity"""
+    __slots__ = ('faculty_id', 'scientist_id')
 
-    def __init__(self):
-        self.faculty_id = None
-        self.scientist_id = None
+    def __init__(self, faculty_id=None, scientist_id=None):
+        self.faculty_id = faculty_id
+        self.scientist_id = scientist_id
 
     def __str__(self):
         return f"ScientistWorksAtFaculty(faculty_id={self.faculty_id}, scientist_id=({self.scientist_id})"
@@ -1,128 +1,190 @@
+import bisect
+import collections
+import concurrent.futures
+import contextlib
+import csv
 import datetime
 import decimal
+import functools
+import itertools
+import multiprocessing
+import operator
+import os
 import random
 
 from faker import Faker
-from faker.providers import person, phone_number, address, date_time, lorem
+from faker.providers import date_time
 
 import exercise_2.scripts.constants as c
 import exercise_2.scripts.entities as ent
 
+_randint = random.randint
+_randrange = random.randrange
+_random = random.random
+_random_choice = random.choice
+_random_choices = random.choices
+
+# two decimal places of the monetary amounts, budgets and fees are quantized to it
+_CENTS = decimal.Decimal('1.00')
+# budget brackets, the upper bounds (exclusive) of each bracket and the funding duration in days of every bracket
+_FUNDING_BUDGET_LIMITS = (500000, 1000000, 2000000, 3000000, 4000001)
+_FUNDING_DAYS = (24 * 7, 48 * 7, 72 * 7, 96 * 7, 110 * 7, 140 * 7)
+# budget brackets, the upper bounds (exclusive) of each bracket and the phd working hours range of every bracket
+_WORKING_HOURS_BUDGET_LIMITS = (500001, 1000000, 2000000, 3000000, 4000001)
+_WORKING_HOURS = ((500, 500), (501, 1000), (1001, 2000), (2001, 3000), (3001, 4000), (4001, 7000))
+# average length of a lorem word, counting the space and punctuation that follow it
+_CHARS_PER_WORD = 7
+# the entity generators draw their columns in chunks of this many rows, so their memory does not grow with n
+_GENERATION_CHUNK = 1000
+
+
+def _format_date(date):
+    """
+    :param date: a date object
+    :return: the date formatted as dd/mm/YYYY, without parsing a strftime format on every call
+    """
+    return f"{date.day:02d}/{date.month:02d}/{date.year}"
+
+
+@functools.lru_cache(maxsize=None)
+def _date_range_ordinals(start_date, end_date):
+    """
+    Resolves a faker style date range once, instead of parsing it on every date_between call
+    :param start_date: start_date, e.g. '-30y'
+    :param end_date: end_date, e.g. '-10y'
+    :return: a tuple with the day ordinals of the start and end dates
+    """
+    parse_date = date_time.Provider._parse_date
+    return parse_date(start_date).toordinal(), parse_date(end_date).toordinal()
+
+
+class FakeGenerator(object):
+    """Class used for generating fake data"""
+    __slots__ = ('_fake', '_fake_gr', '_fake_us', '_street_name', '_building_number', '_cities', '_postcode',
+                 '_male_names', '_female_names', '_word_list')
 
-class BaseMixin(object):
-    """BaseMixin"""
-
-    def __init__(self, fake: Faker):
-        self._fake_gr = fake['el-GR']
-        self._fake_us = fake['en-US']
-
-    def __str__(self):
-        return "BaseMixin"
-
-
-class GreekAddressMixin(BaseMixin):
-    """GreekAddressMixin"""
-    def __init__(self, fake: Faker):
-        super(GreekAddressMixin, self).__init__(fake)
-        self._fake_gr.add_provider(address)
+    def __init__(self):
+        self._fake = Faker(['en-US', 'el-GR'])
+        self._fake_gr = self._fake['el-GR']
+        self._fake_us = self._fake['en-US']
+        # cache the provider methods once, instead of looking them up on every call
+        self._street_name = self._fake_gr.street_name
+        self._building_number = self._fake_gr.building_number
+        self._postcode = self._fake_gr.postcode
+        # cache the data of the providers that pick uniformly from a plain tuple, random.choice over the tuple gives
+        # the same result without faker's random_element machinery
+        self._cities = self._fake_gr.city.__self__.cities
+        person_provider = self._fake_gr.first_name_male.__self__
+        # (first names, last names) pairs, so that a single coin flip picks the pair of the gender
+        self._male_names = (person_provider.first_names_male, person_provider.last_names_male)
+        self._female_names = (person_provider.first_names_female, person_provider.last_names_female)
+        # the lorem word pool, sentences and texts are assembled out of it instead of through faker
+        self._word_list = tuple(self._fake_us.words.__self__.word_list)
 
     def address_name(self):
-        return self._fake_gr.street_name()
+        return self._street_name()
 
     def address_number(self):
-        return self._fake_gr.building_number()
+        return self._building_number()
 
     def city(self):
-        return self._fake_gr.city()
+        return _random_choice(self._cities)
 
     def postal_code(self):
-        return self._fake_gr.postcode()
-
-    def __str__(self):
-        return "GreekAddressMixin"
-
-
-class GreekPersonMixin(BaseMixin):
-    """GreekPersonMixin"""
-    def __init__(self, fake: Faker):
-        super(GreekPersonMixin, self).__init__(fake)
-        self._fake_gr.add_provider(person)
-        self._fake_gr.add_provider(phone_number)
+        return self._postcode()
 
     def first_name_and_last_name(self):
-        gender = 'Male' if random.randint(0, 1) == 0 else 'Female'
-        if gender == 'Male':
-            return self._fake_gr.first_name_male(), self._fake_gr.last_name_male()
-        return self._fake_gr.first_name_female(), self._fake_gr.last_name_female()
-
-    def __str__(self):
-        return "GreekPersonMixin"
-
+        first_names, last_names = self._male_names if _random() < 0.5 else self._female_names
+        return _random_choice(first_names), _random_choice(last_names)
 
-class DateTimeMixin(BaseMixin):
-    """DateTimeMixin"""
-    def __init__(self, fake: Faker):
-        super(DateTimeMixin, self).__init__(fake)
-        self._fake_us.add_provider(date_time)
-
-    def date(self, start_date='-30y', end_date='-10y'):
+    @staticmethod
+    def date(start_date='-30y', end_date='-10y'):
         """
         :param start_date: start_date
         :param end_date: end_date
         """
-        date = self._fake_us.date_between(start_date=start_date, end_date=end_date)
-        return date.strftime("%d/%m/%Y")
+        start_ord, end_ord = _date_range_ordinals(start_date, end_date)
+        return _format_date(datetime.date.fromordinal(_randint(start_ord, end_ord)))
 
-    def funding_start_end_date(self, funding):
+    @staticmethod
+    def funding_start_end_date(funding):
         """
         :param funding: the funding amount
         :return: a tuple of start and end dates
         """
-        date = self._fake_us.date_between(start_date='-3y', end_date='-1y')
-        if funding in range(500000):
-            delta = datetime.timedelta(weeks=24)
-        elif funding in range(500001, 1000000):
-            delta = datetime.timedelta(weeks=48)
-        elif funding in range(1000001, 2000000):
-            delta = datetime.timedelta(weeks=72)
-        elif funding in range(2000001, 3000000):
-            delta = datetime.timedelta(weeks=96)
-        elif funding in range(3000001, 4000001):
-            delta = datetime.timedelta(weeks=110)
-        else:
-            delta = datetime.timedelta(weeks=140)
-        return date.strftime("%d/%m/%Y"), (date + delta).strftime("%d/%m/%Y")
-
-    def __str__(self):
-        return "DateTimeMixin"
-
-
-class USLoremMixin(BaseMixin):
-    """USLoremMixin"""
-    def __init__(self, fake: Faker):
-        super(USLoremMixin, self).__init__(fake)
-        self._fake_us.add_provider(lorem)
+        start_ord, end_ord = _date_range_ordinals('-3y', '-1y')
+        # work on day ordinals, adding the duration to an int instead of a timedelta to a date
+        date_ord = _randint(start_ord, end_ord)
+        end_date_ord = date_ord + _FUNDING_DAYS[bisect.bisect_right(_FUNDING_BUDGET_LIMITS, funding)]
+        fromordinal = datetime.date.fromordinal
+        return _format_date(fromordinal(date_ord)), _format_date(fromordinal(end_date_ord))
 
     def sentence(self, nb_words=10):
         """
         :param nb_words: Number of words to be included
         """
-        return self._fake_us.sentence(nb_words=nb_words)
+        return self.sentence_from_words(_random_choices(self._word_list, k=nb_words))
 
     def text(self, max_nb_chars=200):
         """
-        :param max_nb_chars: Number of characters to be included
+        :param max_nb_chars: Maximum number of characters to be included
+        :return: a text of at most max_nb_chars characters
         """
-        return self._fake_us.text(max_nb_chars)
-
-    def __str__(self):
-        return "USLoremMixin"
+        if max_nb_chars < 5:
+            raise ValueError("text() can only generate text of at least 5 characters")
+        if max_nb_chars < 25:
+            return self._short_text(max_nb_chars)
+        # draw a word more than the average fits, the overflowing tail is cut below
+        text = self.text_from_words(_random_choices(self._word_list, k=max_nb_chars // _CHARS_PER_WORD + 1))
+        if len(text) <= max_nb_chars:
+            return text
+        # keep the full sentences that fit, or else a single sentence of the words that fit
+        end = text.rfind(".", 0, max_nb_chars)
+        if end != -1:
+            return text[:end + 1]
+        return self._short_text(max_nb_chars)
+
+    def _short_text(self, max_nb_chars):
+        """
+        :param max_nb_chars: Maximum number of characters to be included
+        :return: a single sentence of the whole words that fit in max_nb_chars characters, like faker's short texts
+        """
+        word_list = self._word_list
+        words, size = [], -1
+        while True:
+            word = _random_choice(word_list)
+            # the word needs a separating space before it and leaves room for the closing period
+            if size + len(word) + 2 > max_nb_chars:
+                if words:
+                    break
+                continue
+            words.append(word)
+            size += len(word) + 1
+        return self.sentence_from_words(words)
 
+    @staticmethod
+    def sentence_from_words(words):
+        """
+        :param words: the words of the sentence
+        :return: the words joined into a sentence, an empty string if there are no words
+        """
+        if not words:
+            return ""
+        return " ".join(words).capitalize() + "."
 
-class MiscMixin(BaseMixin):
-    """MiscMixin"""
-    def __init__(self, fake: Faker):
-        super(MiscMixin, self).__init__(fake)
+    @staticmethod
+    def text_from_words(words):
+        """
+        :param words: the words of the text
+        :return: the words joined into sentences of four to eight words each, like faker's text
+        """
+        sentences = []
+        idx = 0
+        while idx < len(words):
+            nb_words = _randint(4, 8)
+            sentences.append(FakeGenerator.sentence_from_words(words[idx:idx + nb_words]))
+            idx += nb_words
+        return " ".join(sentences)
 
     @staticmethod
     def budget(start=500000, limit=4000000):
@@ -131,14 +193,12 @@ class MiscMixin(BaseMixin):
         :param limit: budget limit
         :return: a float number
         """
-        num = format(random.randint(start, limit), '.2f')
-        return decimal.Decimal(num)
+        return decimal.Decimal(_randint(start, limit)).quantize(_CENTS)
 
     @staticmethod
     def fee():
         """ The conference fee """
-        num = format(random.randint(20, 100), '.2f')
-        return decimal.Decimal(num)
+        return decimal.Decimal(_randint(20, 100)).quantize(_CENTS)
 
     @staticmethod
     def phd_working_hours(budget):
@@ -146,66 +206,154 @@ class MiscMixin(BaseMixin):
         :param budget: the phd budget
         :return: a number representing the working hours spent on a phd
         """
-        if budget in range(500001):
-            return 500
-        elif budget in range(500002, 1000000):
-            return random.randint(501, 1000)
-        elif budget in range(1000001, 2000000):
-            return random.randint(1001, 2000)
-        elif budget in range(2000001, 3000000):
-            return random.randint(2001, 3000)
-        elif budget in range(3000001, 4000001):
-            return random.randint(3001, 4000)
-        else:
-            return random.randint(4001, 7000)
+        low, high = _WORKING_HOURS[bisect.bisect_right(_WORKING_HOURS_BUDGET_LIMITS, budget)]
+        return _randint(low, high)
 
     @staticmethod
     def publication_wins_first_prize():
         """ A publication has 10% to win the first prize """
-        flip = random.random()
+        flip = _random()
         return True if flip < 0.1 else False
 
     @staticmethod
     def is_volunteer():
         """ A scientist has a 15% to be a volunteer in a conference """
-        flip = random.random()
+        flip = _random()
         return True if flip < 0.15 else False
 
     @staticmethod
     def choices_no_replacement(population, weights=None, k=1):
         result = []
         for n in range(k):
-            pos = random.choices(
-                range(len(population)),
-                weights,
-                k=1
-            )[0]
+            if weights:
+                pos = _random_choices(
+                    range(len(population)),
+                    weights,
+                    k=1
+                )[0]
+            else:
+                # without weights there is nothing to accumulate, a plain index draw is enough
+                pos = _randrange(len(population))
             result.append(population[pos])
             del population[pos]
             if weights:
                 del weights[pos]
         return result
 
+    def clear_unique(self):
+        """Clears the unique data generated"""
+        self._fake.unique.clear()
+
+    @contextlib.contextmanager
+    def unique_scope(self):
+        """
+        Scopes the unique data to the with block, the block starts with an empty registry and the registry from
+        before the block is restored on exit, so that the registry of faker does not keep growing across batches
+        :return: a context manager yielding the generator itself
+        """
+        unique = self._fake.unique
+        seen = unique._seen
+        unique._seen = {}
+        try:
+            yield self
+        finally:
+            unique._seen = seen
+
     def __str__(self):
-        return "MiscMixin"
+        return f"_FakeGenerator(fake_id={id(self._fake)})"
 
 
-class FakeGenerator(GreekAddressMixin, GreekPersonMixin, DateTimeMixin, USLoremMixin, MiscMixin):
-    """Class used for generating fake data"""
+# built on first use, so that importers which never draw faker data do not pay for loading its locales
+_fg = None
 
-    def __init__(self):
-        self._fake = Faker(['en-US', 'el-GR'])
-        super(FakeGenerator, self).__init__(self._fake)
 
-    def clear_unique(self):
-        """Clears the unique data generated"""
-        self._fake.unique.clear()
+def _get_fg():
+    """
+    :return: the module's FakeGenerator, built on the first call
+    """
+    global _fg
+    if _fg is None:
+        _fg = FakeGenerator()
+    return _fg
+
+
+class _AliasTable(object):
+    """
+    Weighted sampler built with Vose's alias method, drawing each element in constant time
+    instead of the binary search random.choices does over the cumulative weights
+    """
+    __slots__ = ('_population', '_prob', '_alias')
+
+    def __init__(self, population, weights):
+        """
+        :param population: the population to sample from
+        :param weights: the relative weights of the population
+        """
+        n = len(population)
+        total = sum(weights)
+        scaled = [w * n / total for w in weights]
+        prob, alias = [1.0] * n, list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            prob[less], alias[less] = scaled[less], more
+            scaled[more] -= 1.0 - scaled[less]
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+        # whatever is left over is 1.0 up to rounding errors, so it keeps its default prob and alias
+        self._population = tuple(population)
+        self._prob = tuple(prob)
+        self._alias = tuple(alias)
+
+    def sample(self, k):
+        """
+        :param k: number of samples
+        :return: a list of k elements sampled with replacement
+        """
+        population, prob, alias = self._population, self._prob, self._alias
+        n, rnd = len(population), _random
+        samples = []
+        append = samples.append
+        for _ in range(k):
+            # a single uniform draw picks both the column and the coin of the alias table
+            u = rnd() * n
+            i = int(u)
+            append(population[i] if u - i < prob[i] else population[alias[i]])
+        return samples
 
     def __str__(self):
-        return f"_FakeGenerator(fake_id={id(self._fake)})"
+        return f"_AliasTable(size={len(self._population)})"
 
 
-_fg = FakeGenerator()
+# alias tables of the weighted samplings, built once instead of on every random.choices call
+_FACULTY_TABLE = _AliasTable(c.FACULTIES["names"], c.FACULTIES["weights"])
+_SCIENTIST_TITLE_TABLE = _AliasTable(c.SCIENTIST_TITLES["names"], c.SCIENTIST_TITLES["weights"])
+_FUNDER_TABLE = _AliasTable(c.FUNDING["names"], c.FUNDING["weights"])
+
+
+def _titles_and_texts(title_sizes, text_sizes):
+    """
+    :param title_sizes: the number of words of each title
+    :param text_sizes: the number of characters of each text
+    :return: a tuple of the list of titles and the list of texts
+    """
+    fg = _get_fg()
+    sentence, text = fg.sentence, fg.text
+    return [sentence(size) for size in title_sizes], [text(size) for size in text_sizes]
+
+
+def _iter_column_chunks(columns_fn, n, start):
+    """
+    :param columns_fn: a generate_*_columns function of a factory
+    :param n: number of rows to be generated
+    :param start: the starting id
+    :return: a generator of the column dictionaries of consecutive chunks of at most _GENERATION_CHUNK rows
+    """
+    for chunk_start in range(start, n + start, _GENERATION_CHUNK):
+        yield columns_fn(min(_GENERATION_CHUNK, n + start - chunk_start), chunk_start)
 
 
 class AddressFactory(object):
@@ -218,11 +366,11 @@ class AddressFactory(object):
         :param n: number of objects to be generated
         :param start: the starting id
         """
+        # bind the generator methods once, instead of resolving them on every row
+        fg = _get_fg()
+        address_name, address_number, city, postal_code = fg.address_name, fg.address_number, fg.city, fg.postal_code
         for address_id in range(start, n + start):
-            data = {"address_id": address_id, "address_name": _fg.address_name(),
-                    "address_number": _fg.address_number(), "city": _fg.city(), "country": c.GREECE,
-                    "postal_code": _fg.postal_code()}
-            yield ent.Address.build_from_data(data)
+            yield ent.Address(address_id, address_name(), address_number(), city(), c.GREECE, postal_code())
 
     def __str__(self):
         return "AddressFactory"
@@ -238,9 +386,8 @@ class FacultyFactory(object):
         :param n: number of objects to be generated
         :param start: the starting id
         """
-        for fac_id, name in enumerate(random.choices(c.FACULTIES["names"], c.FACULTIES["weights"], k=n), start=start):
-            data = {"faculty_id": fac_id, "name": name, "university_name": c.EKPA}
-            yield ent.Faculty.build_from_data(data)
+        for fac_id, name in enumerate(_FACULTY_TABLE.sample(n), start=start):
+            yield ent.Faculty(fac_id, name, c.EKPA)
 
     @staticmethod
     def generate_unique_faculties():
@@ -248,8 +395,7 @@ class FacultyFactory(object):
         Generator of unique Faculty objects
         """
         for fac_id, name in enumerate(c.FACULTIES["names"], start=1):
-            data = {"faculty_id": fac_id, "name": name, "university_name": c.EKPA}
-            yield ent.Faculty.build_from_data(data)
+            yield ent.Faculty(fac_id, name, c.EKPA)
 
     def __str__(self):
         return "FacultyFactory"
@@ -265,11 +411,9 @@ class ScientistFactory(object):
         :param n: number of objects to be generated
         :param start: the starting id
         """
-        for sct_id, title in enumerate(random.choices(c.SCIENTIST_TITLES["names"],
-                                                      c.SCIENTIST_TITLES["weights"], k=n), start=start):
-            name, surname = _fg.first_name_and_last_name()
-            data = {"scientist_id": sct_id, "title": title, "name": name, "surname": surname}
-            yield ent.Scientist.build_from_data(data)
+        first_name_and_last_name = _get_fg().first_name_and_last_name
+        for sct_id, title in enumerate(_SCIENTIST_TITLE_TABLE.sample(n), start=start):
+            yield ent.Scientist(sct_id, title, *first_name_and_last_name())
 
     @staticmethod
     def generate_scientists_per_title(n=10, start=1):
@@ -278,7 +422,7 @@ class ScientistFactory(object):
         :return: A dictionary mapping scientists to their title
         :param start: the starting id
         """
-        mapper = {key: [] for key in c.SCIENTIST_TITLES["names"]}
+        mapper = collections.defaultdict(list)
         for sct in ScientistFactory.generate_scientists(n, start):
             mapper[sct.title].append(sct)
         return mapper
@@ -297,12 +441,26 @@ class PHDFactory(object):
         :param n: number of objects to be generated
         :param start: the starting id
         """
-        for phd_id in range(start, n + start):
-            nb_words = random.randint(11, 22)
-            max_nb_chars = random.randint(1000, 2000)
-            data = {"phd_id": phd_id, "date_received": _fg.date(),
-                    "description": _fg.text(max_nb_chars=max_nb_chars), "title": _fg.sentence(nb_words=nb_words)}
-            yield ent.PHD.build_from_data(data)
+        for columns in _iter_column_chunks(PHDFactory.generate_phd_columns, n, start):
+            for phd_id, date_received, description, title in zip(columns["phd_id"], columns["date_received"],
+                                                                  columns["description"], columns["title"]):
+                yield ent.PHD(phd_id, date_received=date_received, description=description, title=title)
+
+    @staticmethod
+    def generate_phd_columns(n=10, start=1):
+        """
+        Generates the PHD data column by column, without building any PHD objects
+        :param n: number of rows to be generated
+        :param start: the starting id
+        :return: a dictionary mapping each PHD attribute to the list of its values
+        """
+        randint = _randint
+        title_sizes = [randint(11, 22) for _ in range(n)]
+        description_sizes = [randint(1000, 2000) for _ in range(n)]
+        titles, descriptions = _titles_and_texts(title_sizes, description_sizes)
+        date = FakeGenerator.date
+        return {"phd_id": list(range(start, n + start)), "date_received": [date() for _ in range(n)],
+                "description": descriptions, "title": titles}
 
     def __str__(self):
         return "PHDFactory"
@@ -318,9 +476,8 @@ class ConferenceFactory(object):
         """
         for conf_id, data in enumerate(c.CONFERENCES, start=1):
             title, start_date, end_date = data
-            data = {"conference_id": conf_id, "start_date": start_date, "end_date": end_date, "title": title,
-                    "fee": _fg.fee()}
-            yield ent.Conference.build_from_data(data)
+            yield ent.Conference(conf_id, start_date=start_date, end_date=end_date, title=title,
+                                 fee=FakeGenerator.fee())
 
     def __str__(self):
         return "ConferenceFactory"
@@ -336,12 +493,23 @@ class PublicationFactory(object):
         :param n: number of objects to be generated
         :param start: the starting id
         """
-        for pub_id in range(start, n + start):
-            nb_words = random.randint(10, 15)
-            max_nb_chars = random.randint(2000, 3000)
-            data = {"publication_id": pub_id, "title": _fg.sentence(nb_words), "summary": _fg.text(max_nb_chars),
-                    "won_first_prize": False}
-            yield ent.Publication.build_from_data(data)
+        for columns in _iter_column_chunks(PublicationFactory.generate_publication_columns, n, start):
+            for pub_id, title, summary in zip(columns["publication_id"], columns["title"], columns["summary"]):
+                yield ent.Publication(pub_id, title=title, summary=summary, won_first_prize=False)
+
+    @staticmethod
+    def generate_publication_columns(n=10, start=1):
+        """
+        Generates the Publication data column by column, without building any Publication objects
+        :param n: number of rows to be generated
+        :param start: the starting id
+        :return: a dictionary mapping each Publication attribute to the list of its values
+        """
+        randint = _randint
+        title_sizes = [randint(10, 15) for _ in range(n)]
+        summary_sizes = [randint(2000, 3000) for _ in range(n)]
+        titles, summaries = _titles_and_texts(title_sizes, summary_sizes)
+        return {"publication_id": list(range(start, n + start)), "title": titles, "summary": summaries}
 
     def __str__(self):
         return "PublicationFactory"
@@ -357,12 +525,114 @@ class FundingFactory(object):
         :param n: number of objects to be generated
         :param start: the starting id
         """
-        for fund_id, funder in enumerate(random.choices(c.FUNDING["names"], c.FUNDING["weights"], k=n), start=start):
-            budget = _fg.budget()
-            start_date, end_date = _fg.funding_start_end_date(budget)
-            data = {"funding_id": fund_id, "funder": funder, "budget": budget, "start_date": start_date,
-                    "end_date": end_date}
-            yield ent.Funding.build_from_data(data)
+        for columns in _iter_column_chunks(FundingFactory.generate_funding_columns, n, start):
+            for fund_id, funder, budget, start_date, end_date in zip(columns["funding_id"], columns["funder"],
+                                                                     columns["budget"], columns["start_date"],
+                                                                     columns["end_date"]):
+                yield ent.Funding(fund_id, funder=funder, budget=budget, start_date=start_date, end_date=end_date)
+
+    @staticmethod
+    def generate_funding_columns(n=10, start=1):
+        """
+        Generates the Funding data column by column, without building any Funding objects
+        :param n: number of rows to be generated
+        :param start: the starting id
+        :return: a dictionary mapping each Funding attribute to the list of its values
+        """
+        budgets, start_dates, end_dates = FundingFactory._budgets_and_dates(n)
+        return {"funding_id": list(range(start, n + start)), "funder": _FUNDER_TABLE.sample(n), "budget": budgets,
+                "start_date": start_dates, "end_date": end_dates}
+
+    @staticmethod
+    def _budgets_and_dates(n):
+        """
+        Fills the budget, start date and end date columns in a single pass, drawing each budget right before the
+        dates that depend on it
+        :param n: number of rows
+        :return: a tuple of the budget, start date and end date lists, the dates formatted as dd/mm/YYYY
+        """
+        new_budget, funding_start_end_date = FakeGenerator.budget, FakeGenerator.funding_start_end_date
+        budgets, start_dates, end_dates = [], [], []
+        for _ in range(n):
+            budget = new_budget()
+            start_date, end_date = funding_start_end_date(budget)
+            budgets.append(budget)
+            start_dates.append(start_date)
+            end_dates.append(end_date)
+        return budgets, start_dates, end_dates
 
     def __str__(self):
         return "PublicationFactory"
+
+
+def _init_worker():
+    """Builds the FakeGenerator of the worker process once, before its first task"""
+    global _fg
+    _fg = FakeGenerator()
+
+
+def _generate_shard(factory_fn, n, start):
+    """
+    :param factory_fn: the generator function of the factory, e.g. FundingFactory.generate_funding
+    :param n: number of objects to be generated
+    :param start: the starting id of the shard
+    :return: the list of the generated objects
+    """
+    return list(factory_fn(n=n, start=start))
+
+
+def generate_parallel(factory_fn, n, start=1, workers=None):
+    """
+    Generates the objects of a factory in worker processes, each shard getting a contiguous range of ids,
+    so that the ids are the same as the ones of a sequential run
+    :param factory_fn: the generator function of the factory, e.g. FundingFactory.generate_funding
+    :param n: number of objects to be generated
+    :param start: the starting id
+    :param workers: number of worker processes, defaults to the number of cpus
+    :return: a generator of the generated objects, in id order
+    """
+    workers = min(workers or multiprocessing.cpu_count(), n) or 1
+    chunk, extra = divmod(n, workers)
+    shards = []
+    for i in range(workers):
+        shard_n = chunk + (1 if i < extra else 0)
+        shards.append((shard_n, start))
+        start += shard_n
+    # spawned workers import their own module globals, instead of inheriting the random state of this process
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                                initializer=_init_worker) as executor:
+        futures = [executor.submit(_generate_shard, factory_fn, shard_n, shard_start)
+                   for shard_n, shard_start in shards]
+        shard_results = [future.result() for future in futures]
+    return itertools.chain.from_iterable(shard_results)
+
+
+def write_to_csv(path, factory_generator, batch_size=10000):
+    """
+    Streams the objects of a factory generator to a csv file while they are generated, so that only one batch of
+    rows and the current chunk of the generator are held in memory, not all of the n objects
+    :param path: the path of the csv file
+    :param factory_generator: a generator of entity objects, e.g. FundingFactory.generate_funding(n)
+    :param batch_size: number of objects written with each writerows call
+    :return: the number of objects written
+    """
+    count = 0
+    objs = iter(factory_generator)
+    with open(path, "w", newline="", encoding="utf-8") as csv_file:
+        writer = csv.writer(csv_file)
+        first = next(objs, None)
+        if first is not None:
+            # the slots of the entities double as the header and the column order of the rows
+            fields = first.__slots__
+            writer.writerow(fields)
+            to_row = operator.attrgetter(*fields)
+            objs = itertools.chain((first,), objs)
+            while True:
+                batch = [to_row(obj) for obj in itertools.islice(objs, batch_size)]
+                if not batch:
+                    break
+                writer.writerows(batch)
+                count += len(batch)
+        csv_file.flush()
+        os.fsync(csv_file.fileno())
+    return count